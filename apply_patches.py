@@ -0,0 +1,76 @@
+import mmap
+import os
+import sys
+
+from patches import PATCHES, PatchError, apply
+
+file_path = "C:/Users/Roberto/Desktop/Quick/LaunchPro/launchpro-app/launchpro-app/services/campaign-orchestrator.service.ts"
+
+
+def write_parts(path, parts, mode=0o644):
+    """Write `parts` to `path` in order, with vectored writes where the OS has them."""
+    if not hasattr(os, 'writev'):
+        with open(path, 'wb') as f:
+            f.writelines(parts)
+        return
+    pending = [memoryview(part) for part in parts]
+    # More than IOV_MAX buffers is rejected with EINVAL, so hand them over in groups
+    iov_max = os.sysconf('SC_IOV_MAX') if 'SC_IOV_MAX' in os.sysconf_names else 0
+    if iov_max <= 0:
+        iov_max = 1024
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        while pending:
+            # writev may still write fewer bytes than asked; resume where it left off
+            written = os.writev(fd, pending[:iov_max])
+            while pending and written >= len(pending[0]):
+                written -= len(pending[0])
+                pending.pop(0)
+            if written:
+                pending[0] = pending[0][written:]
+    finally:
+        # Drop the views right away so the caller can close the mapping even on error
+        pending.clear()
+        os.close(fd)
+
+
+# The output is written next to the target and swapped in afterwards: its
+# pieces are views into the mapping, so the target can't be truncated yet.
+tmp_path = file_path + '.tmp'
+
+with open(file_path, 'rb') as f, \
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+    try:
+        table, spans = apply(content)
+    except PatchError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+
+    # Rewriting identical content would still bump the mtime and make the
+    # Next.js dev server recompile, so only write when a patch changes bytes
+    changed = any(old != new for _, _, old, new in spans)
+    if changed:
+        parts = table.views()
+        try:
+            write_parts(tmp_path, parts, os.fstat(f.fileno()).st_mode & 0o777)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        finally:
+            parts.clear()
+
+if changed:
+    os.replace(tmp_path, file_path)
+
+applied = {name for _, name, _, _ in spans}
+for name, _, _ in PATCHES:
+    if name in applied:
+        print(f"SUCCESS: {name} applied")
+    else:
+        print(f"SKIPPED: {name} already applied")
+
+if changed:
+    print(f"DONE: {len(applied)} changes applied")
+else:
+    print("NO-OP: nothing to change, file left untouched")
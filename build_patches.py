@@ -0,0 +1,20 @@
+"""
+Prebuild the ABO video patch table used by apply_patches.py
+
+Reads every patches/*.ts.tmpl pair once and stores them in patches/patches.pkl.
+Rerun after editing a template; a stale table is ignored until then.
+
+Usage:
+  python build_patches.py
+"""
+
+import pickle
+
+from patches import COMPILED_PATH, build_patches
+
+patches = build_patches()
+
+with open(COMPILED_PATH, 'wb') as f:
+    pickle.dump(patches, f)
+
+print(f"DONE: {len(patches)} patches written to {COMPILED_PATH}")
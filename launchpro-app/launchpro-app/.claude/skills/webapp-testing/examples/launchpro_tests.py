@@ -12,32 +12,62 @@ Usage:
   python scripts/with_server.py --server "npm run dev" --port 3000 -- python examples/launchpro_tests.py
 """
 
-from playwright.sync_api import sync_playwright
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from playwright.sync_api import sync_playwright, expect, TimeoutError as PlaywrightTimeoutError
+import os
 import time
 
 # Configuration
 BASE_URL = "http://localhost:3000"
 TEST_EMAIL = "test@example.com"
 TEST_PASSWORD = "testpassword123"
+# Waits target specific elements, so fail fast instead of Playwright's 30s default
+DEFAULT_TIMEOUT_MS = 5000
+# Login session saved after a successful login and reused while fresh
+AUTH_STATE_PATH = ".auth.json"
+AUTH_STATE_MAX_AGE = 3600  # seconds
+# Page tests are split across this many browsers; each lane shares one page
+TEST_WORKERS = 3
+
+# Push through the Next.js client router when the app is already loaded
+CLIENT_NAVIGATE_JS = """(path) => {
+    const router = window.next && window.next.router;
+    if (!router || typeof router.push !== 'function') return false;
+    router.push(path);
+    return true;
+}"""
+
+
+def navigate(page, path):
+    """Open a LaunchPro path, client-side when possible to skip a full reload and hydrate"""
+    previous_url = page.url
+    if previous_url.startswith(BASE_URL) and page.evaluate(CLIENT_NAVIGATE_JS, path):
+        if previous_url != f"{BASE_URL}{path}":
+            page.wait_for_url(lambda url: url != previous_url)
+    else:
+        page.goto(f"{BASE_URL}{path}")
 
 
 def test_login_flow(page):
     """Test the login flow"""
     print("Testing login flow...")
 
-    page.goto(f"{BASE_URL}/login")
-    page.wait_for_load_state('networkidle')
+    navigate(page, "/login")
+    page.wait_for_selector('#email', state='visible')
 
     # Fill login form
-    page.fill('input[name="email"]', TEST_EMAIL)
-    page.fill('input[name="password"]', TEST_PASSWORD)
+    page.fill('#email', TEST_EMAIL)
+    page.fill('#password', TEST_PASSWORD)
 
     # Submit
     page.click('button[type="submit"]')
-    page.wait_for_load_state('networkidle')
+    try:
+        page.wait_for_url(lambda url: "/login" not in url)
+    except PlaywrightTimeoutError:
+        raise AssertionError(f"Still on login page after submit: {page.url}")
 
-    # Verify redirect to dashboard
-    assert "/dashboard" in page.url, f"Expected dashboard, got {page.url}"
+    # Verify redirect to the callbackUrl (/campaigns by default) or the dashboard
+    assert "/campaigns" in page.url or "/dashboard" in page.url, f"Expected campaigns or dashboard, got {page.url}"
     print("Login flow: PASSED")
 
 
@@ -45,14 +75,13 @@ def test_campaign_list(page):
     """Test campaign list page loads correctly"""
     print("Testing campaign list...")
 
-    page.goto(f"{BASE_URL}/campaigns")
-    page.wait_for_load_state('networkidle')
+    navigate(page, "/campaigns")
 
     # Check for campaign table or empty state
     table = page.locator('table')
     empty_state = page.locator('text=No campaigns found')
 
-    assert table.count() > 0 or empty_state.count() > 0, "Neither table nor empty state found"
+    expect(table.or_(empty_state).first, "Neither table nor empty state found").to_be_visible(timeout=3000)
     print("Campaign list: PASSED")
 
 
@@ -60,12 +89,11 @@ def test_new_campaign_form(page):
     """Test new campaign form elements exist"""
     print("Testing new campaign form...")
 
-    page.goto(f"{BASE_URL}/campaigns/new")
-    page.wait_for_load_state('networkidle')
+    navigate(page, "/campaigns/new")
 
     # Check for key form elements
-    assert page.locator('input[name="name"]').count() > 0, "Campaign name field not found"
-    assert page.locator('select').count() > 0, "Platform selector not found"
+    expect(page.locator('input[name="name"]').first, "Campaign name field not found").to_be_visible(timeout=3000)
+    expect(page.locator('select').first, "Platform selector not found").to_be_visible(timeout=3000)
 
     print("New campaign form: PASSED")
 
@@ -74,12 +102,13 @@ def test_rules_page(page):
     """Test rules page loads with ROAS calculator"""
     print("Testing rules page...")
 
-    page.goto(f"{BASE_URL}/rules")
-    page.wait_for_load_state('networkidle')
+    navigate(page, "/rules")
 
-    # Check for rules content
-    content = page.content()
-    assert "ROAS" in content or "reglas" in content.lower(), "Rules content not found"
+    # Check for rules content (matched in the browser, without serializing the DOM)
+    try:
+        page.locator('text=/ROAS|reglas/i').first.wait_for(timeout=3000)
+    except PlaywrightTimeoutError:
+        raise AssertionError("Rules content not found")
 
     print("Rules page: PASSED")
 
@@ -88,12 +117,11 @@ def test_compliance_dashboard(page):
     """Test compliance dashboard loads"""
     print("Testing compliance dashboard...")
 
-    page.goto(f"{BASE_URL}/compliance")
-    page.wait_for_load_state('networkidle')
+    navigate(page, "/compliance")
 
     # Check for compliance elements
     heading = page.locator('h1')
-    assert heading.count() > 0, "No heading found on compliance page"
+    expect(heading.first, "No heading found on compliance page").to_be_visible(timeout=3000)
 
     print("Compliance dashboard: PASSED")
 
@@ -102,14 +130,13 @@ def test_analytics_page(page):
     """Test analytics page with Looker embed"""
     print("Testing analytics page...")
 
-    page.goto(f"{BASE_URL}/analytics")
-    page.wait_for_load_state('networkidle')
+    navigate(page, "/analytics")
 
     # Check for iframe (Looker embed) or configuration message
     iframe = page.locator('iframe')
     config_message = page.locator('text=no configurado')
 
-    assert iframe.count() > 0 or config_message.count() > 0, "Neither iframe nor config message found"
+    expect(iframe.or_(config_message).first, "Neither iframe nor config message found").to_be_visible(timeout=3000)
 
     print("Analytics page: PASSED")
 
@@ -118,66 +145,145 @@ def test_settings_page(page):
     """Test settings page (SUPERADMIN only)"""
     print("Testing settings page...")
 
-    page.goto(f"{BASE_URL}/settings")
-    page.wait_for_load_state('networkidle')
+    navigate(page, "/settings")
 
-    # Check for settings tabs
-    tabs = page.locator('text=General')
+    # Wait for the settings tabs, or for the redirect away from /settings
+    # (non-SUPERADMIN users go to /campaigns, logged-out users to /login)
+    page.wait_for_function(
+        "() => !location.pathname.startsWith('/settings') || document.body.innerText.includes('General')"
+    )
 
-    # Might redirect to login or show 403 if not SUPERADMIN
     if "/login" in page.url:
         print("Settings page: SKIPPED (requires auth)")
         return
+    if "/campaigns" in page.url:
+        print("Settings page: SKIPPED (requires SUPERADMIN)")
+        return
 
     print("Settings page: PASSED")
 
 
-def take_screenshot(page, name):
-    """Helper to take screenshots for debugging"""
-    page.screenshot(path=f"/tmp/launchpro_{name}.png", full_page=True)
-    print(f"Screenshot saved: /tmp/launchpro_{name}.png")
+def has_fresh_auth_state():
+    """Check for a saved login session younger than AUTH_STATE_MAX_AGE"""
+    return (
+        os.path.exists(AUTH_STATE_PATH)
+        and time.time() - os.path.getmtime(AUTH_STATE_PATH) < AUTH_STATE_MAX_AGE
+    )
 
 
-def run_all_tests():
-    """Run all LaunchPro tests"""
+def session_is_valid(context):
+    """Probe the NextAuth session endpoint with the context's cookies"""
+    try:
+        response = context.request.get(f"{BASE_URL}/api/auth/session")
+        return response.ok and bool((response.json() or {}).get("user"))
+    except Exception:
+        return False
+
+
+def take_screenshot(page, name):
+    """Helper to take screenshots for debugging (viewport only, JPEG for fast encoding)"""
+    path = f"/tmp/launchpro_{name}.jpg"
+    page.screenshot(path=path, full_page=False, type='jpeg', quality=60)
+    print(f"Screenshot saved: {path}")
+
+
+def run_test(page, name, test_fn):
+    """Run a single test on a page, returning True if it passed"""
+    try:
+        test_fn(page)
+        return True
+    except AssertionError as e:
+        print(f"{name}: FAILED - {e}")
+        take_screenshot(page, f"{name}_failed")
+    except Exception as e:
+        print(f"{name}: ERROR - {e}")
+        take_screenshot(page, f"{name}_error")
+    return False
+
+
+def run_in_context(storage_state, lane):
+    """Run a lane of tests on one page in its own browser context, seeded with the login session"""
+    # The sync API is bound to the thread that started it, so each worker drives its own browser
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=True)
-        context = browser.new_context()
+        context = browser.new_context(storage_state=storage_state)
+        context.set_default_timeout(DEFAULT_TIMEOUT_MS)
         page = context.new_page()
+        try:
+            # Only the first test loads the app; the rest navigate client-side
+            return [run_test(page, name, test_fn) for name, test_fn in lane]
+        finally:
+            browser.close()
 
-        tests = [
-            ("login", test_login_flow),
-            ("campaigns", test_campaign_list),
-            ("new_campaign", test_new_campaign_form),
-            ("rules", test_rules_page),
-            ("compliance", test_compliance_dashboard),
-            ("analytics", test_analytics_page),
-            ("settings", test_settings_page),
-        ]
 
-        passed = 0
-        failed = 0
+def run_all_tests():
+    """Run all LaunchPro tests"""
+    passed = 0
+    failed = 0
 
-        for name, test_fn in tests:
-            try:
-                test_fn(page)
+    # Log in once (or reuse a recent saved session) and capture it for the other tests
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        context = None
+
+        if has_fresh_auth_state():
+            context = browser.new_context(storage_state=AUTH_STATE_PATH)
+            if session_is_valid(context):
+                print("Login flow: SKIPPED (reusing saved session)")
+            else:
+                context.close()
+                context = None
+
+        if context is None:
+            context = browser.new_context()
+            context.set_default_timeout(DEFAULT_TIMEOUT_MS)
+            page = context.new_page()
+
+            if run_test(page, "login", test_login_flow):
                 passed += 1
-            except AssertionError as e:
-                print(f"{name}: FAILED - {e}")
-                take_screenshot(page, f"{name}_failed")
-                failed += 1
-            except Exception as e:
-                print(f"{name}: ERROR - {e}")
-                take_screenshot(page, f"{name}_error")
+            else:
                 failed += 1
 
+            # Save the session whenever the sign-in itself worked, even if the redirect check failed
+            if session_is_valid(context):
+                context.storage_state(path=AUTH_STATE_PATH)
+
+        storage_state = context.storage_state()
+
         browser.close()
 
-        print(f"\n{'='*40}")
-        print(f"Results: {passed} passed, {failed} failed")
-        print(f"{'='*40}")
+    # The remaining tests are read-only and independent, so run them in parallel lanes
+    tests = [
+        ("campaigns", test_campaign_list),
+        ("new_campaign", test_new_campaign_form),
+        ("rules", test_rules_page),
+        ("compliance", test_compliance_dashboard),
+        ("analytics", test_analytics_page),
+        ("settings", test_settings_page),
+    ]
+
+    lanes = [tests[i::TEST_WORKERS] for i in range(TEST_WORKERS) if tests[i::TEST_WORKERS]]
+
+    with ThreadPoolExecutor(max_workers=len(lanes)) as executor:
+        futures = {
+            executor.submit(run_in_context, storage_state, lane): lane
+            for lane in lanes
+        }
+        for future in as_completed(futures):
+            try:
+                results = future.result()
+            except Exception as e:
+                lane = futures[future]
+                print(f"{', '.join(name for name, _ in lane)}: ERROR - {e}")
+                results = [False] * len(lane)
+            passed += results.count(True)
+            failed += results.count(False)
+
+    print(f"\n{'='*40}")
+    print(f"Results: {passed} passed, {failed} failed")
+    print(f"{'='*40}")
 
-        return failed == 0
+    return failed == 0
 
 
 if __name__ == "__main__":
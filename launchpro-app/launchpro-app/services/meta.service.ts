@@ -1,6 +1,7 @@
 import axios, { AxiosInstance } from 'axios';
 import { env } from '@/lib/env';
 import FormData from 'form-data';
+import { Readable } from 'stream';
 
 /**
  * Meta (Facebook/Instagram) Ads API Service
@@ -457,12 +458,13 @@ class MetaService {
 
   /**
    * Upload a video
+   * Accepts a Readable (e.g. an axios 'stream' response) so large videos are piped through without buffering
    */
-  async uploadVideo(videoPath: string | Buffer, filename?: string, adAccountId?: string, accessToken?: string): Promise<string> {
+  async uploadVideo(videoPath: string | Buffer | Readable, filename?: string, adAccountId?: string, accessToken?: string): Promise<string> {
     const accountId = adAccountId || this.adAccountId;
     const formData = new FormData();
 
-    if (Buffer.isBuffer(videoPath)) {
+    if (Buffer.isBuffer(videoPath) || videoPath instanceof Readable) {
       formData.append('source', videoPath, filename || 'video.mp4');
     } else {
       formData.append('source', videoPath);
@@ -569,6 +571,106 @@ class MetaService {
     }
   }
 
+  /**
+   * Create ad creatives and their ads through the Graph API batch endpoint
+   * Each ad references its creative's result, so one call covers up to 25 creative + ad pairs
+   * Results are returned in the same order as `items`
+   */
+  async createAdsBatch(
+    items: Array<{ creative: MetaAdCreativeParams; ad: Omit<MetaAdParams, 'creative'> }>,
+    adAccountId?: string,
+    accessToken?: string
+  ): Promise<Array<{ creativeId: string; adId: string }>> {
+    const accountId = adAccountId || this.adAccountId;
+    const maxBatchRequests = 50;
+    const itemsPerBatch = maxBatchRequests / 2;
+    const encodeBody = (params: Record<string, unknown>) => new URLSearchParams(
+      Object.entries(params).map(([key, value]) => [key, typeof value === 'string' ? value : JSON.stringify(value)])
+    ).toString();
+
+    const client = this.getClient(accessToken);
+    const results: Array<{ creativeId: string; adId: string }> = [];
+
+    for (let start = 0; start < items.length; start += itemsPerBatch) {
+      const chunk = items.slice(start, start + itemsPerBatch);
+      const batch = chunk.flatMap(({ creative, ad }, i) => {
+        const adPayload: any = {
+          name: ad.name,
+          adset_id: ad.adset_id,
+          creative: { creative_id: `{result=creative${i}:$.id}` },
+          status: ad.status || 'PAUSED',
+        };
+
+        if (ad.tracking_specs) {
+          adPayload.tracking_specs = ad.tracking_specs;
+        }
+
+        return [
+          {
+            method: 'POST',
+            relative_url: `${accountId}/adcreatives`,
+            name: `creative${i}`,
+            omit_response_on_success: false,
+            body: encodeBody(creative as unknown as Record<string, unknown>),
+          },
+          {
+            method: 'POST',
+            relative_url: `${accountId}/ads`,
+            body: encodeBody(adPayload),
+          },
+        ];
+      });
+
+      let responses: any[];
+      try {
+        const response = await client.post('/', { batch: JSON.stringify(batch) });
+        responses = response.data;
+      } catch (error: any) {
+        const metaError = error.response?.data?.error || {};
+        console.error('[META] ❌ Batch ad creation failed:', {
+          accountId,
+          message: metaError.message || error.message,
+          type: metaError.type,
+          code: metaError.code,
+          error_subcode: metaError.error_subcode,
+          fbtrace_id: metaError.fbtrace_id,
+          error_user_msg: metaError.error_user_msg,
+          fullError: error.response?.data,
+          itemCount: chunk.length,
+        });
+        throw error;
+      }
+
+      // Sub-request responses come back in request order: creative, ad, creative, ad, ...
+      chunk.forEach(({ creative, ad }, i) => {
+        const ids = [responses[2 * i], responses[2 * i + 1]].map((result, step) => {
+          const body = result?.body ? JSON.parse(result.body) : null;
+          if (result && result.code === 200) {
+            return body.id as string;
+          }
+
+          const metaError = body?.error || {};
+          console.error(`[META] ❌ Batch ${step === 0 ? 'AdCreative' : 'Ad'} creation failed:`, {
+            accountId,
+            message: metaError.message || 'No response (dependent request failed)',
+            type: metaError.type,
+            code: metaError.code,
+            error_subcode: metaError.error_subcode,
+            fbtrace_id: metaError.fbtrace_id,
+            error_user_msg: metaError.error_user_msg,
+            fullError: body,
+            payload: step === 0 ? creative : { name: ad.name, adset_id: ad.adset_id, status: ad.status },
+          });
+          throw new Error(`Meta batch ${step === 0 ? 'creative' : 'ad'} creation failed for ${ad.name}: ${metaError.message || 'no response'}`);
+        });
+
+        results.push({ creativeId: ids[0], adId: ids[1] });
+      });
+    }
+
+    return results;
+  }
+
   /**
    * Get ad details
    */
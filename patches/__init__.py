@@ -0,0 +1,199 @@
+"""
+ABO multiple video patches for services/campaign-orchestrator.service.ts
+
+apply() runs every patch over the orchestrator source in one pass:
+1. Detect multiple videos when choosing the ad creation strategy
+2. Keep the single video branch for single video campaigns only
+3. Add the ABO multiple video ads branch
+
+The TypeScript for each patch lives next to this module as .ts.tmpl files,
+stored with LF and matched against LF or CRLF sources.
+build_patches.py prebuilds them into patches.pkl, which is loaded while it
+is newer than the templates.
+"""
+
+import mmap
+import os
+import pickle
+import re
+from dataclasses import dataclass, field
+
+try:
+    import ahocorasick  # optional: pip install pyahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+class PatchError(Exception):
+    """Raised when the patch anchors can't be matched in the source"""
+
+
+@dataclass
+class PieceTable:
+    """Edited copy of `source` kept as (buffer, start, end) pieces instead of one buffer
+
+    Replacing splits a source piece in three, so each edit costs O(pieces) rather
+    than a copy of the whole file. Only source pieces are searched, so a patch
+    never matches text inserted by another.
+    """
+    source: object
+    pieces: list = field(init=False)
+
+    def __post_init__(self):
+        self.pieces = [(self.source, 0, len(self.source))]
+
+    def find_and_replace(self, old, new, hint=0):
+        """Replace the first `old` at or after source offset `hint`; False if there is none"""
+        for idx, (buf, start, end) in enumerate(self.pieces):
+            if buf is not self.source or end <= hint:
+                continue
+            pos = buf.find(old, max(start, hint), end)
+            if pos >= 0:
+                self.pieces[idx:idx + 1] = [(buf, start, pos), (new, 0, len(new)), (buf, pos + len(old), end)]
+                return True
+        return False
+
+    def views(self):
+        """Return the non-empty pieces as memoryviews, in output order"""
+        return [memoryview(buf)[start:end] for buf, start, end in self.pieces if end > start]
+
+
+TEMPLATE_DIR = os.path.dirname(os.path.abspath(__file__))
+COMPILED_PATH = os.path.join(TEMPLATE_DIR, 'patches.pkl')
+
+# Each patch replaces <stem>.old.ts.tmpl with <stem>.ts.tmpl
+PATCH_STEMS = [
+    ("Detection logic", "detection"),
+    ("Single video branch condition", "single_video"),
+    ("ABO multiple videos branch", "abo_multi_video"),
+]
+
+
+def load_template(name):
+    """Read a sidecar template as bytes, dropping the trailing newline editors add"""
+    with open(os.path.join(TEMPLATE_DIR, name), 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        end = len(mm) - 1 if mm[-1:] == b'\n' else len(mm)
+        return mm[:end]
+
+
+def build_patches():
+    """Read every patch's anchor and replacement from its templates"""
+    return [
+        (name, load_template(f"{stem}.old.ts.tmpl"), load_template(f"{stem}.ts.tmpl"))
+        for name, stem in PATCH_STEMS
+    ]
+
+
+def load_patches():
+    """Load the prebuilt patch table, or the templates if it's missing or stale"""
+    try:
+        built_at = os.path.getmtime(COMPILED_PATH)
+    except OSError:
+        return build_patches()
+    sources = [os.path.abspath(__file__)] + [
+        os.path.join(TEMPLATE_DIR, name) for name in os.listdir(TEMPLATE_DIR) if name.endswith('.tmpl')
+    ]
+    if any(os.path.getmtime(path) > built_at for path in sources):
+        return build_patches()
+    with open(COMPILED_PATH, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return pickle.loads(mm)
+
+
+PATCHES = load_patches()
+
+
+def compile_anchors(patches):
+    """Compile the patch anchors into a single regex alternation"""
+    return re.compile(b'|'.join(
+        b'(?P<p%d>%s)' % (idx, re.escape(old)) for idx, (_, old, _) in enumerate(patches)
+    ))
+
+
+ANCHOR_PATTERN = compile_anchors(PATCHES)
+
+
+def locate_anchors(content, patches):
+    """Return the start offset of each patch anchor in `content`, or -1 when missing."""
+    if ahocorasick is None:
+        # Same single sweep with the stdlib: one alternation, one named group per patch
+        pattern = ANCHOR_PATTERN if patches is PATCHES else compile_anchors(patches)
+        offsets = [-1] * len(patches)
+        remaining = len(patches)
+        for match in pattern.finditer(content):
+            idx = int(match.lastgroup[1:])
+            if offsets[idx] < 0:
+                offsets[idx] = match.start()
+                remaining -= 1
+                if not remaining:
+                    break
+        return offsets
+
+    # One sweep for all anchors. latin-1 maps each byte to one character,
+    # so offsets in the decoded text are byte offsets in `content`.
+    automaton = ahocorasick.Automaton()
+    for idx, (_, old, _) in enumerate(patches):
+        automaton.add_word(old.decode('latin-1'), idx)
+    automaton.make_automaton()
+    offsets = [-1] * len(patches)
+    remaining = len(patches)
+    for end, idx in automaton.iter(str(content, 'latin-1')):
+        if offsets[idx] < 0:
+            offsets[idx] = end - len(patches[idx][1]) + 1
+            remaining -= 1
+            if not remaining:
+                break
+    return offsets
+
+
+def locate(content, patches=PATCHES):
+    """Return (start, name, old, new) for each patch anchor, ordered by position in `content`
+
+    Patches whose anchor is gone but whose replacement is already present are
+    left out, so running over an already patched file locates nothing.
+    """
+    spans = []
+    cursor = 0
+    offsets = locate_anchors(content, patches)
+    for (name, old, new), pos in sorted(zip(patches, offsets), key=lambda item: item[1]):
+        if pos < 0:
+            if content.find(new) >= 0:
+                continue
+            raise PatchError(f"Could not find anchor for: {name}")
+        if pos < cursor:
+            raise PatchError(f"Anchor for {name} overlaps the previous patch")
+        spans.append((pos, name, old, new))
+        cursor = pos + len(old)
+    return spans
+
+
+def splice(content, spans):
+    """Return a PieceTable of `content` with every located anchor replaced"""
+    table = PieceTable(content)
+    for start, _, old, new in spans:
+        # The anchor was already located, so this find succeeds at `start` right away
+        table.find_and_replace(old, new, hint=start)
+    return table
+
+
+def with_line_endings(content, patches):
+    """Return `patches` with LF line endings translated to match `content`
+
+    The templates are stored with LF; a CRLF checkout of the orchestrator
+    (e.g. git autocrlf on Windows) gets anchors and replacements in CRLF.
+    """
+    if content.find(b'\r\n') < 0:
+        return patches
+    return [(name, old.replace(b'\n', b'\r\n'), new.replace(b'\n', b'\r\n')) for name, old, new in patches]
+
+
+def apply(content):
+    """Apply every patch to `content` in one pass
+
+    Returns the patched PieceTable together with the located spans, so
+    callers can report which patches were applied and write the pieces
+    without joining them. Raises PatchError if an anchor is missing.
+    """
+    spans = locate(content, with_line_endings(content, PATCHES))
+    return splice(content, spans), spans